@@ -12,6 +12,21 @@ Suite de jeux Tkinter :
 import tkinter as tk
 from tkinter import messagebox
 import random
+import sys
+import os
+import time
+import argparse
+import fileinput
+import multiprocessing
+import struct
+import queue
+import math
+from collections import deque, namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # only needed for the batched evaluation helpers
+    np = None
 
 #####################
 # Themes
@@ -63,7 +78,8 @@ class ThemedFrame(tk.Frame):
                 widget.config(bg=theme['button_bg'])
 
         elif isinstance(widget, tk.Entry):
-            widget.config(bg=theme['bg'], fg=theme['fg'])
+            # Disabled entries (Sudoku givens) draw with disabledbackground
+            widget.config(bg=theme['bg'], fg=theme['fg'], disabledbackground=theme['bg'])
         elif isinstance(widget, tk.Frame):
             widget.config(bg=theme['bg'])
             for c in widget.winfo_children():
@@ -85,6 +101,7 @@ class GameApp(tk.Tk):
         self.is_dark = True
         self.theme = DARK if self.is_dark else LIGHT
         self.bind_all("<Control-d>", lambda e: self.toggle_theme())
+        self.protocol("WM_DELETE_WINDOW", self.close)
 
         container = tk.Frame(self, bg=self.theme['bg'])
         container.pack(fill='both', expand=True)
@@ -114,6 +131,10 @@ class GameApp(tk.Tk):
         self.fullscreen = False
         self.attributes("-fullscreen", False)
 
+    def close(self):
+        save_opening_book()
+        self.destroy()
+
     def toggle_theme(self):
         self.is_dark = not self.is_dark
         self.theme = DARK if self.is_dark else LIGHT
@@ -144,7 +165,7 @@ class MainMenu(ThemedFrame):
 
     def quit_app(self):
         if messagebox.askyesno("Quitter", "Voulez-vous vraiment quitter ?"):
-            self.controller.destroy()
+            self.controller.close()
 
 
 #####################
@@ -500,18 +521,24 @@ class CheckersFrame(ThemedFrame):
         self.board_frame = tk.Frame(self)
         self.board_frame.pack()
 
+        self.analysis = None
+        self.analysis_label = tk.Label(self, text="", font=("Courier", 11), justify='left')
+
         self.reset_board()
 
+        styled_button(self, text="Analyse", command=self.start_analysis, width=15, height=1).pack(pady=5)
         styled_button(self, text="Reset Game", command=self.reset_board, width=15, height=1).pack(pady=5)
         styled_button(self, text="Retour", command=lambda: controller.show_frame('MainMenu'), width=15, height=1).pack(
             pady=10)
+        self.analysis_label.pack(pady=4)
 
     # --- Setup and UI Methods ---
     def reset_board(self):
+        self.stop_analysis()
         for w in self.board_frame.winfo_children():
             w.destroy()
 
-        self.board = [['' for _ in range(self.size)] for _ in range(self.size)]
+        self.board = checkers_start_board(self.size)
         self.squares = []
 
         for r in range(self.size):
@@ -519,12 +546,7 @@ class CheckersFrame(ThemedFrame):
             for c in range(self.size):
                 # NOTE: Checkers squares use fixed light/dark colors independent of theme
                 color = '#555555' if (r + c) % 2 != 0 else '#FFFFFF'
-                piece_text = ''
-
-                if r < 3 and (r + c) % 2 != 0:
-                    piece_text = 'b'
-                if r > 4 and (r + c) % 2 != 0:
-                    piece_text = 'r'
+                piece_text = self.board[r][c]
 
                 b = tk.Button(
                     self.board_frame,
@@ -537,7 +559,6 @@ class CheckersFrame(ThemedFrame):
                 )
                 b.grid(row=r, column=c)
                 row.append(b)
-                self.board[r][c] = piece_text
             self.squares.append(row)
 
         self.selected = None
@@ -570,6 +591,62 @@ class CheckersFrame(ThemedFrame):
         location = "Bottom" if self.turn == 'r' else 'Top'
         self.turn_label.config(text=f"Turn: {color_name} ({location})")
 
+    # --- Analysis ---
+    def start_analysis(self):
+        if self.analysis is not None:
+            return
+        self.analysis = RootAnalysis('checkers', self.board, self.turn, time_limit=3.0).start()
+        self.analysis_label.config(text="Analyse en cours...")
+        self.after(100, self._poll_analysis)
+
+    def stop_analysis(self):
+        if self.analysis is not None:
+            self.analysis.close()
+            self.analysis = None
+        self.analysis_label.config(text="")
+
+    def _poll_analysis(self):
+        analysis = self.analysis
+        if analysis is None:
+            return
+        # The position changed under the analysis: its results no longer apply
+        if analysis.board != self.board or analysis.turn != self.turn:
+            self.stop_analysis()
+            return
+        analysis.poll()
+        lines = []
+        # Book scores are self-play score rates, search scores are evaluations: list them apart
+        if analysis.book_moves:
+            lines.append("Livre d'ouvertures (points marqués) :")
+            lines += [f"{self._move_name(move):<14}{points * 50 / games:>7.0f}%  ({games} parties)"
+                      for move, games, points in analysis.book_moves]
+        searched = len(analysis.moves) - len(analysis.book_moves)
+        if searched:
+            lines.append("Recherche :")
+            first, rest = analysis.ranked_groups()
+            lines += [f"{self._move_name(move):<14}{self._score_text(score):>8}  (prof. {depth})"
+                      for move, score, depth in first]
+            if rest:
+                lines.append("Autres profondeurs (non comparables) :")
+                lines += [f"{self._move_name(move):<14}{self._score_text(score):>8}  (prof. {depth})"
+                          for move, score, depth in rest]
+        if analysis.done:
+            self.analysis = None
+            lines.append("Analyse terminée." if analysis.moves else "Aucun coup possible.")
+        else:
+            lines.append(f"Analyse en cours... {len(analysis.results)}/{searched}")
+            self.after(100, self._poll_analysis)
+        self.analysis_label.config(text="\n".join(lines))
+
+    def _move_name(self, path):
+        sep = 'x' if abs(path[1][0] - path[0][0]) == 2 else '-'
+        return sep.join(f"{'abcdefgh'[c]}{self.size - r}" for r, c in path)
+
+    def _score_text(self, score):
+        if abs(score) > SEARCH_WIN // 2:
+            return "gagne" if score > 0 else "perd"
+        return f"{score / 100:+.2f}"
+
     # --- Move Validation Helpers ---
     def get_available_jumps(self, turn):
         jumps = []
@@ -716,8 +793,8 @@ class SudokuFrame(ThemedFrame):
         [6, '', '', 1, 9, 5, '', '', ''],
         ['', 9, 8, '', '', '', '', 6, ''],
         [8, '', '', '', 6, '', '', '', 3],
-        [4, '', '8', '', 3, '', '', '', 1],
-        [7, '', '', 2, '', '', '', 6, ''],
+        [4, '', '', 8, '', 3, '', '', 1],
+        [7, '', '', '', 2, '', '', '', 6],
         ['', '6', '', '', '', '', 2, 8, ''],
         ['', '', '', '4', 1, 9, '', '', 5],
         ['', '', '', '', 8, '', '', 7, 9]
@@ -740,10 +817,54 @@ class SudokuFrame(ThemedFrame):
                     e.config(state='disabled')
                 row.append(e)
             self.entries.append(row)
+        self.candidates = SudokuCandidates(sudoku_from_rows(self.PUZZLE))
+        self.hint_label = tk.Label(self, text="", font=("Helvetica", 12), wraplength=600)
+        self.hint_label.pack(pady=4)
+        styled_button(self, text="Indice", command=self.show_hint, width=15, height=1).pack(pady=6)
         styled_button(self, text="Vérifier solution", command=self.check_solution, width=15, height=1).pack(pady=6)
         styled_button(self, text="Retour", command=lambda: controller.show_frame('MainMenu'), width=15, height=1).pack(
             pady=6)
 
+    def _read_grid(self):
+        grid = []
+        for r in range(9):
+            for c in range(9):
+                v = self.entries[r][c].get().strip()
+                grid.append(int(v) if len(v) == 1 and v in '123456789' else 0)
+        return grid
+
+    def show_hint(self):
+        theme = self.controller.theme
+        for row in self.entries:
+            for e in row:
+                e.config(bg=theme['bg'], disabledbackground=theme['bg'])
+
+        # Sync the candidate grid with the entries: new digits are placed
+        # incrementally, a cleared or changed cell forces a rebuild.
+        grid = self._read_grid()
+        if any(v and v != grid[i] for i, v in enumerate(self.candidates.grid)):
+            self.candidates = SudokuCandidates(grid)
+        else:
+            for i, v in enumerate(grid):
+                if v and not self.candidates.grid[i]:
+                    self.candidates.place(i, v)
+
+        if not self.candidates.ok:
+            self.hint_label.config(text="La grille contient une erreur.")
+            return
+        step = self.candidates.next_step()
+        if step is None:
+            text = "Grille complète !" if all(grid) else "Aucun indice logique disponible."
+            self.hint_label.config(text=text)
+            return
+
+        # Eliminations are remembered; placements are left for the player to enter
+        for i, d in step.eliminations:
+            self.candidates.eliminate(i, d)
+        for i in step.cells:
+            self.entries[SUDOKU_ROW[i]][SUDOKU_COL[i]].config(bg='#A8DF8E', disabledbackground='#A8DF8E')
+        self.hint_label.config(text=step.message)
+
     def check_solution(self):
         # NOTE: This is a placeholder check and does not implement actual Sudoku validation
         try:
@@ -757,10 +878,1211 @@ class SudokuFrame(ThemedFrame):
             messagebox.showerror("Erreur", "Remplissez toutes les cases avec un entier 1-9")
 
 
+#####################
+# Checkers Logic (headless)
+#####################
+# Same board layout as CheckersFrame: 8x8 lists of '', 'r', 'b', 'R', 'B'
+# (upper case = king), red moves up, black moves down. A move is a path of
+# squares; multi-jumps are a single move.
+CHECKERS_DARK = [(r, c) for r in range(8) for c in range(8) if (r + c) % 2 != 0]
+
+
+def checkers_start_board(size=8):
+    board = [['' for _ in range(size)] for _ in range(size)]
+    for r in range(size):
+        for c in range(size):
+            if (r + c) % 2 != 0:
+                if r < 3:
+                    board[r][c] = 'b'
+                elif r > size - 4:
+                    board[r][c] = 'r'
+    return board
+
+
+def _checkers_dirs(piece):
+    if piece.isupper():
+        return (-1, 1)
+    return (-1,) if piece == 'r' else (1,)
+
+
+def _checkers_crown(piece, r, size):
+    if piece == 'r' and r == 0:
+        return 'R'
+    if piece == 'b' and r == size - 1:
+        return 'B'
+    return piece
+
+
+def _checkers_jump_paths(board, r, c, piece, turn, path, paths):
+    size = len(board)
+    extended = False
+    for dr in _checkers_dirs(piece):
+        for dc in (-1, 1):
+            mr, mc, er, ec = r + dr, c + dc, r + 2 * dr, c + 2 * dc
+            if 0 <= er < size and 0 <= ec < size and board[er][ec] == '':
+                mid = board[mr][mc]
+                if mid and mid.lower() != turn:
+                    board[mr][mc] = ''
+                    board[r][c] = ''
+                    board[er][ec] = piece
+                    _checkers_jump_paths(board, er, ec, _checkers_crown(piece, er, size), turn,
+                                         path + [(er, ec)], paths)
+                    board[er][ec] = ''
+                    board[r][c] = piece
+                    board[mr][mc] = mid
+                    extended = True
+    if not extended and len(path) > 1:
+        paths.append(tuple(path))
+
+
+def checkers_moves(board, turn):
+    # Legal moves for turn; captures are mandatory, as in CheckersFrame
+    size = len(board)
+    jumps, steps = [], []
+    for r in range(size):
+        for c in range(size):
+            piece = board[r][c]
+            if not piece or piece.lower() != turn:
+                continue
+            _checkers_jump_paths(board, r, c, piece, turn, [(r, c)], jumps)
+            if jumps:
+                continue
+            for dr in _checkers_dirs(piece):
+                for dc in (-1, 1):
+                    er, ec = r + dr, c + dc
+                    if 0 <= er < size and 0 <= ec < size and board[er][ec] == '':
+                        steps.append(((r, c), (er, ec)))
+    return jumps if jumps else steps
+
+
+def checkers_apply(board, path):
+    # Returns a new board with the move played
+    board = [row[:] for row in board]
+    size = len(board)
+    (r, c) = path[0]
+    piece = board[r][c]
+    board[r][c] = ''
+    for er, ec in path[1:]:
+        if abs(er - r) == 2:
+            board[(r + er) // 2][(c + ec) // 2] = ''
+        r, c = er, ec
+    board[r][c] = _checkers_crown(piece, r, size)
+    return board
+
+
+#####################
+# Checkers Opening Book
+#####################
+# Positions are folded by colour flip (180 degree turn + colour swap) so the
+# side to move is always red. A left/right mirror is not used: it moves pieces
+# to the light squares and swaps the single and double corners, so it does not
+# preserve the game.
+_CHECKERS_SWAP = {'': '', 'r': 'b', 'b': 'r', 'R': 'B', 'B': 'R'}
+_CHECKERS_CODE = {'': 0, 'r': 1, 'b': 2, 'R': 3, 'B': 4}
+
+
+def checkers_key(board, turn):
+    # Returns (canonical key, flipped?); the key is a perfect hash < 5**32
+    flip = turn == 'b'
+    key = 0
+    for r, c in (reversed(CHECKERS_DARK) if not flip else CHECKERS_DARK):
+        piece = board[r][c]
+        key = key * 5 + _CHECKERS_CODE[_CHECKERS_SWAP[piece] if flip else piece]
+    return key, flip
+
+
+def checkers_transform_path(flip, path):
+    # Colour flip is its own inverse, so this maps both ways
+    return tuple((7 - r, 7 - c) for r, c in path) if flip else tuple(path)
+
+
+class OpeningBook:
+    # Canonical key -> [search depth, score, {canonical path: [games, points]}]
+    # points count 2 per win and 1 per draw for the side to move.
+    MAGIC = b'CKBK\x01'
+    MIN_GAMES = 5  # games a move needs before the book trusts it
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = None
+        self.dirty = False
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = {}
+            if self.path and os.path.exists(self.path):
+                try:
+                    with open(self.path, 'rb') as f:
+                        self._load(f.read())
+                except (OSError, ValueError, IndexError, struct.error) as exc:
+                    # Unreadable or corrupt: play on with an empty book and never overwrite the file
+                    print(f"checkers book: cannot read {self.path} ({exc}); using an empty book", file=sys.stderr)
+                    self._entries = {}
+                    self.path = None
+        return self._entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _load(self, data):
+        if data[:5] != self.MAGIC:
+            raise ValueError(f"{self.path}: not a checkers book")
+        (count,), pos = struct.unpack_from('>I', data, 5), 9
+        for _ in range(count):
+            key = int.from_bytes(data[pos:pos + 10], 'big')
+            depth, score, nmoves = struct.unpack_from('>BhB', data, pos + 10)
+            pos += 14
+            moves = {}
+            for _ in range(nmoves):
+                length = data[pos]
+                path = tuple(divmod(sq, 8) for sq in data[pos + 1:pos + 1 + length])
+                pos += 1 + length
+                moves[path] = list(struct.unpack_from('>II', data, pos))
+                pos += 8
+            self._entries[key] = [depth, score, moves]
+
+    def save(self, path=None):
+        path = path or self.path
+        out = [self.MAGIC, struct.pack('>I', len(self.entries))]
+        for key, (depth, score, moves) in self.entries.items():
+            out.append(key.to_bytes(10, 'big'))
+            out.append(struct.pack('>BhB', depth, max(-32768, min(32767, score)), len(moves)))
+            for move, (games, points) in moves.items():
+                out.append(bytes([len(move)] + [r * 8 + c for r, c in move]))
+                out.append(struct.pack('>II', games, points))
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp = path + '.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(b''.join(out))
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self.dirty = False
+
+    def save_if_dirty(self):
+        # Never raises: a failed write is reported once and the book stays in memory
+        if self.dirty and self.path:
+            try:
+                self.save()
+            except OSError as exc:
+                print(f"checkers book: cannot save {self.path} ({exc}); keeping it in memory", file=sys.stderr)
+                self.path = None
+
+    def _entry(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = [0, 0, {}]
+        return entry
+
+    # --- Opening moves ---
+    @staticmethod
+    def confidence(games, points):
+        # Wilson lower bound (95%) on the score rate, so a single lucky win
+        # does not outrank a move that scored well over many games
+        n, p, z = games, points / (2 * games), 1.96
+        return (p + z * z / (2 * n) - z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))) / (1 + z * z / n)
+
+    def book_moves(self, board, turn):
+        # [(path, games, points), ...] for this position, best first
+        key, t = checkers_key(board, turn)
+        entry = self.entries.get(key)
+        if not entry:
+            return []
+        moves = sorted(entry[2].items(), key=lambda kv: (self.confidence(*kv[1]), kv[1][0]), reverse=True)
+        return [(checkers_transform_path(t, move), games, points) for move, (games, points) in moves]
+
+    def best_move(self, board, turn):
+        # Best move with at least MIN_GAMES games behind it, or None
+        for path, games, _ in self.book_moves(board, turn):
+            if games >= self.MIN_GAMES:
+                return path
+        return None
+
+    def record_game(self, history, winner, max_plies=20):
+        # history: [(board, turn, path), ...] from the start; winner 'r', 'b' or None for a draw
+        for board, turn, path in history[:max_plies]:
+            key, t = checkers_key(board, turn)
+            stats = self._entry(key)[2].setdefault(checkers_transform_path(t, path), [0, 0])
+            stats[0] += 1
+            stats[1] += 2 if winner == turn else (1 if winner is None else 0)
+        self.dirty = True
+
+    # --- Position cache ---
+    def lookup(self, board, turn):
+        # Cached (depth, score) from the side to move's point of view, or None
+        entry = self.entries.get(checkers_key(board, turn)[0])
+        if not entry or not entry[0]:
+            return None
+        return entry[0], entry[1]
+
+    def store(self, board, turn, depth, score):
+        entry = self._entry(checkers_key(board, turn)[0])
+        if depth >= entry[0]:
+            entry[0], entry[1] = min(depth, 255), score
+            self.dirty = True
+
+
+# Per-user data directory, so the book also works for read-only installs
+CHECKERS_BOOK_PATH = os.path.join(
+    (os.environ.get('APPDATA') or os.path.expanduser('~')) if os.name == 'nt'
+    else (os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')),
+    'games', 'checkers_book.bin')
+_opening_book = None
+
+
+def get_opening_book():
+    # Shared by every checkers game in the process; the file is read on first use
+    global _opening_book
+    if _opening_book is None:
+        _opening_book = OpeningBook(CHECKERS_BOOK_PATH)
+    return _opening_book
+
+
+def save_opening_book():
+    # Writes back cache entries and self-play results gathered in this process
+    if _opening_book is not None:
+        _opening_book.save_if_dirty()
+
+
+def checkers_self_play(book, games=100, seed=None, explore=0.3, max_plies=150, book_plies=20, depth=2):
+    # Plays games and feeds the results back into the book. Each side plays a
+    # trusted book move, else the best move of a shallow search (depth plies,
+    # 0 for random); with probability explore it plays a random move instead,
+    # so new openings keep being tried.
+    rng = random.Random(seed)
+    results = {'r': 0, 'b': 0, None: 0}
+    for _ in range(games):
+        board, turn, history, winner = checkers_start_board(), 'r', [], None
+        for ply in range(max_plies):
+            moves = checkers_moves(board, turn)
+            if not moves:
+                winner = 'b' if turn == 'r' else 'r'
+                break
+            path = None
+            if rng.random() >= explore:
+                if ply < book_plies:
+                    path = book.best_move(board, turn)
+                if path not in moves and depth > 0:
+                    path = _self_play_search(board, turn, moves, depth, rng)
+            if path not in moves:
+                path = rng.choice(moves)
+            history.append((board, turn, path))
+            board = checkers_apply(board, path)
+            turn = 'b' if turn == 'r' else 'r'
+        book.record_game(history, winner, book_plies)
+        results[winner] += 1
+    return results
+
+
+def _self_play_search(board, turn, moves, depth, rng):
+    other = 'b' if turn == 'r' else 'r'
+    scores = [-negamax('checkers', checkers_apply(board, move), other, depth - 1) for move in moves]
+    best = max(scores)
+    return rng.choice([move for move, score in zip(moves, scores) if score == best])
+
+
+def checkers_book_cli(argv):
+    parser = argparse.ArgumentParser(prog='games.py checkers-book',
+                                     description="Grow the checkers opening book from self-play.")
+    parser.add_argument('-n', '--games', type=int, default=100)
+    parser.add_argument('--book', default=CHECKERS_BOOK_PATH)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--explore', type=float, default=0.3, help="share of random moves inside the book")
+    parser.add_argument('--plies', type=int, default=20, help="plies recorded per game")
+    parser.add_argument('--depth', type=int, default=2, help="search depth for moves outside the book (0: random)")
+    args = parser.parse_args(argv)
+
+    book = OpeningBook(args.book)
+    if len(book) == 0 and book.path is None:
+        return 1  # unreadable book, already reported; do not overwrite it
+    start = time.perf_counter()
+    results = checkers_self_play(book, args.games, args.seed, args.explore, book_plies=args.plies, depth=args.depth)
+    try:
+        book.save()
+    except OSError as exc:
+        print(f"checkers-book: cannot save {args.book}: {exc}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"checkers-book: {args.games} games (red {results['r']}, black {results['b']}, draws {results[None]}) "
+          f"in {elapsed:.2f}s, {len(book)} positions in {args.book}", file=sys.stderr)
+    return 0
+
+
+#####################
+# Batched Evaluation (NumPy)
+#####################
+# Tic-tac-toe positions are N x 9 arrays (row-major, 0 empty, 1 'X', -1 'O').
+# Checkers positions are N x 32 arrays over CHECKERS_DARK using _CHECKERS_CODE.
+TTT_LINES = ([[r * 3 + c for c in range(3)] for r in range(3)] +
+             [[r * 3 + c for r in range(3)] for c in range(3)] +
+             [[0, 4, 8], [2, 4, 6]])
+_TTT_CODE = {'': 0, 'X': 1, 'O': -1}
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("batched evaluation needs numpy (pip install numpy)")
+
+
+def ttt_encode(boards):
+    # List of TicTacToeFrame-style 3x3 boards -> N x 9 int8 array
+    _require_numpy()
+    return np.array([[_TTT_CODE[v] for row in b for v in row] for b in boards], dtype=np.int8).reshape(-1, 9)
+
+
+def ttt_evaluate_batch(positions):
+    """Scores many tic-tac-toe positions in one call.
+    Returns a dict of arrays: line sums (N x 8), x_wins, o_wins, full, open lines
+    per player and score, which matches minimax's terminal values (+10 O wins,
+    -10 X wins) and otherwise the open-line difference from O's point of view."""
+    _require_numpy()
+    pos = np.asarray(positions, dtype=np.int8).reshape(-1, 9)
+    cells = pos[:, np.array(TTT_LINES)]                   # N x 8 x 3
+    lines = cells.sum(axis=2, dtype=np.int16)
+    has_x = (cells == 1).any(axis=2)
+    has_o = (cells == -1).any(axis=2)
+    x_wins = (lines == 3).any(axis=1)
+    o_wins = (lines == -3).any(axis=1)
+    x_open = (~has_o).sum(axis=1)
+    o_open = (~has_x).sum(axis=1)
+    score = np.where(o_wins, 10, np.where(x_wins, -10, o_open - x_open)).astype(np.int16)
+    return {
+        'lines': lines,
+        'x_wins': x_wins,
+        'o_wins': o_wins,
+        'full': (pos != 0).all(axis=1),
+        'x_open': x_open,
+        'o_open': o_open,
+        'score': score,
+    }
+
+
+def _checkers_tables():
+    # For each direction: neighbour and jump landing index per square (32 = off board)
+    index = {sq: i for i, sq in enumerate(CHECKERS_DARK)}
+    dirs = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+    step = [[index.get((r + dr, c + dc), 32) for r, c in CHECKERS_DARK] for dr, dc in dirs]
+    jump = [[index.get((r + 2 * dr, c + 2 * dc), 32) for r, c in CHECKERS_DARK] for dr, dc in dirs]
+    rows = [r for r, c in CHECKERS_DARK]
+    return np.array(step), np.array(jump), np.array(rows)
+
+
+_checkers_np_tables = None
+
+
+def checkers_encode(boards):
+    # List of CheckersFrame-style 8x8 boards -> N x 32 int8 array
+    _require_numpy()
+    return np.array([[_CHECKERS_CODE[b[r][c]] for r, c in CHECKERS_DARK] for b in boards],
+                    dtype=np.int8).reshape(-1, 32)
+
+
+def checkers_evaluate_batch(positions):
+    """Scores many checkers positions in one call.
+    Returns a dict of per-side arrays (men, kings, mobility, jumps, advance) plus
+    material and score from red's point of view; men count 1 and kings 1.5."""
+    global _checkers_np_tables
+    _require_numpy()
+    if _checkers_np_tables is None:
+        _checkers_np_tables = _checkers_tables()
+    step, jump, rows = _checkers_np_tables
+
+    pos = np.asarray(positions, dtype=np.int8).reshape(-1, 32)
+    # Extra column so off-board neighbours read as blocked (value 5)
+    padded = np.concatenate([pos, np.full((len(pos), 1), 5, dtype=np.int8)], axis=1)
+    out = {}
+    for side, man, king, enemy_man, enemy_king, forward in (('red', 1, 3, 2, 4, (0, 1)),
+                                                            ('black', 2, 4, 1, 3, (2, 3))):
+        is_man = pos == man
+        is_king = pos == king
+        mobility = np.zeros(len(pos), dtype=np.int16)
+        jumps = np.zeros(len(pos), dtype=np.int16)
+        for d in range(4):
+            movers = is_king | is_man if d in forward else is_king
+            target = padded[:, step[d]]
+            landing = padded[:, jump[d]]
+            mobility += (movers & (target == 0)).sum(axis=1)
+            jumps += (movers & ((target == enemy_man) | (target == enemy_king)) & (landing == 0)).sum(axis=1)
+        # Rows travelled by men towards the crowning row
+        advance = np.where(is_man, 7 - rows if side == 'red' else rows, 0).sum(axis=1)
+        out[side + '_men'] = is_man.sum(axis=1)
+        out[side + '_kings'] = is_king.sum(axis=1)
+        out[side + '_mobility'] = mobility
+        out[side + '_jumps'] = jumps
+        out[side + '_advance'] = advance
+        out[side + '_stuck'] = (mobility + jumps) == 0
+
+    out['material'] = (out['red_men'] - out['black_men'] + 1.5 * (out['red_kings'] - out['black_kings']))
+    out['score'] = (out['material'] + 0.1 * (out['red_mobility'] - out['black_mobility'])
+                    + 0.02 * (out['red_advance'] - out['black_advance']))
+    return out
+
+
+#####################
+# Root-Parallel Analysis
+#####################
+# Each legal root move is searched in its own worker process with iterative
+# deepening until a shared deadline; results stream back as they finish.
+SEARCH_WIN = 30000  # fits the int16 score field of the opening book
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def checkers_evaluate(board, turn):
+    # Material (men 100, kings 150) plus a small advancement bonus, for the side to move
+    score = 0
+    for r, c in CHECKERS_DARK:
+        piece = board[r][c]
+        if piece:
+            value = 150 if piece.isupper() else 100 + (7 - r if piece == 'r' else r) * 2
+            score += value if piece.lower() == turn else -value
+    return score
+
+
+def _checkers_terminal(board, turn, moves):
+    # A side with no legal move has lost
+    return None if moves else -SEARCH_WIN
+
+
+def ttt_lines(size):
+    return ([[(r, c) for c in range(size)] for r in range(size)] +
+            [[(r, c) for r in range(size)] for c in range(size)] +
+            [[(i, i) for i in range(size)], [(i, size - 1 - i) for i in range(size)]])
+
+
+def ttt_moves(board, turn):
+    return [(r, c) for r in range(len(board)) for c in range(len(board)) if board[r][c] == ""]
+
+
+def ttt_apply(board, move, turn):
+    board = [row[:] for row in board]
+    board[move[0]][move[1]] = turn
+    return board
+
+
+def _ttt_terminal(board, turn, moves):
+    # n x n board, a full row, column or diagonal wins (TicTacToeFrame rules)
+    other = "O" if turn == "X" else "X"
+    if any(all(board[r][c] == other for r, c in line) for line in ttt_lines(len(board))):
+        return -SEARCH_WIN
+    return None if moves else 0
+
+
+def ttt_evaluate(board, turn):
+    # Lines still open for the side to move minus lines open for the opponent
+    other = "O" if turn == "X" else "X"
+    score = 0
+    for line in ttt_lines(len(board)):
+        cells = [board[r][c] for r, c in line]
+        if other not in cells:
+            score += 1
+        if turn not in cells:
+            score -= 1
+    return score
+
+
+# game -> (moves, apply, terminal score or None given the moves, static evaluation, next turn)
+ANALYSIS_GAMES = {
+    'checkers': (checkers_moves, lambda board, move, turn: checkers_apply(board, move),
+                 _checkers_terminal, checkers_evaluate, {'r': 'b', 'b': 'r'}),
+    'tictactoe': (ttt_moves, ttt_apply, _ttt_terminal, ttt_evaluate, {'X': 'O', 'O': 'X'}),
+}
+
+
+def negamax(game, board, turn, depth, alpha=-SEARCH_WIN - 1, beta=SEARCH_WIN + 1, ply=0, end=None,
+            horizon=None):
+    # horizon, if given, is a one-item list set to True when the depth limit cut the search
+    moves_fn, apply_fn, terminal_fn, eval_fn, other = ANALYSIS_GAMES[game]
+
+    def search(board, turn, depth, alpha, beta, ply):
+        if end is not None and time.time() > end:
+            raise _SearchTimeout
+        moves = moves_fn(board, turn)
+        terminal = terminal_fn(board, turn, moves)
+        if terminal is not None:
+            # Prefer quick wins and slow losses
+            return terminal + ply if terminal < 0 else terminal
+        if depth == 0:
+            if horizon is not None:
+                horizon[0] = True
+            return eval_fn(board, turn)
+        best = -SEARCH_WIN - 1
+        for move in moves:
+            score = -search(apply_fn(board, move, turn), other[turn], depth - 1, -beta, -alpha, ply + 1)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best
+
+    return search(board, turn, depth, alpha, beta, ply)
+
+
+def analyse_move(game, board, turn, move, end, max_depth=64, cached=None):
+    # Worker: iterative deepening on one root move. Returns (move, score, depth,
+    # scores by depth, exact?) with scores from the root mover's point of view.
+    # cached is an earlier (depth, score) for the child; deepening resumes past it.
+    _, apply_fn, _, eval_fn, other = ANALYSIS_GAMES[game]
+    child = apply_fn(board, move, turn)
+    score, depth, scores, exact = -eval_fn(child, other[turn]), 0, {}, False
+    if cached:
+        score, depth = -cached[1], cached[0] + 1
+        scores[depth] = score
+    for d in range(depth, max_depth):
+        horizon = [False]
+        try:
+            score, depth = -negamax(game, child, other[turn], d, ply=1, end=end, horizon=horizon), d + 1
+        except _SearchTimeout:
+            break
+        scores[depth] = score
+        if not horizon[0] or abs(score) > SEARCH_WIN // 2:
+            exact = True  # exact or forced result, deeper search cannot change it
+            break
+    return move, score, depth, scores, exact
+
+
+class RootAnalysis:
+    """Searches every legal move of a position in parallel.
+    Iterate over it to block on results, or call poll() from a Tk after() loop;
+    results are (move, score, depth) tuples in completion order, see ranked()
+    for how scores from different depths are ordered."""
+
+    def __init__(self, game, board, turn, time_limit=2.0, jobs=None, max_depth=64):
+        self.game = game
+        self.board = [row[:] for row in board]
+        self.turn = turn
+        self.time_limit = time_limit
+        self.jobs = jobs or os.cpu_count() or 1
+        self.max_depth = max_depth
+        self.moves = ANALYSIS_GAMES[game][0](self.board, turn)
+        self.results = []
+        self.book_moves = []
+        self._history = {}  # move -> (scores by depth, exact?)
+        self._queue = queue.Queue()
+        self._pool = None
+        self._pending = 0
+
+    def start(self):
+        # With more moves than workers the queued moves run in later waves, so
+        # each move gets an equal slice of the shared deadline.
+        deadline = time.time() + self.time_limit
+        book = get_opening_book() if self.game == 'checkers' else None
+        # Moves with MIN_GAMES book games are answered by the book (one lookup);
+        # the rest are searched, so every legal move is still reported.
+        searched = self.moves
+        if book is not None:
+            self.book_moves = [m for m in book.book_moves(self.board, self.turn)
+                               if m[0] in self.moves and m[1] >= OpeningBook.MIN_GAMES]
+            covered = {path for path, _, _ in self.book_moves}
+            searched = [move for move in self.moves if move not in covered]
+        # Cached children seed their move's search, which only has to go deeper
+        todo = []
+        for move in searched:
+            cached = None
+            if book is not None:
+                cached = book.lookup(checkers_apply(self.board, move), 'b' if self.turn == 'r' else 'r')
+            if cached and (cached[0] + 1 >= self.max_depth or abs(cached[1]) > SEARCH_WIN // 2):
+                self._queue.put((move, -cached[1], cached[0] + 1, {cached[0] + 1: -cached[1]}, True))
+            else:
+                todo.append((move, cached))
+        self._pending = len(searched)
+        if todo:
+            workers = min(self.jobs, len(todo))
+            waves = -(-len(todo) // workers)
+            self._pool = multiprocessing.Pool(workers)
+            for move, cached in todo:
+                self._pool.apply_async(_analyse_slice, (self.game, self.board, self.turn, move, deadline,
+                                                        self.time_limit / waves, self.max_depth, cached),
+                                       callback=self._queue.put, error_callback=self._failed)
+            self._pool.close()
+        return self
+
+    def _failed(self, exc):
+        self._queue.put(None)
+
+    def _collect(self, item):
+        self._pending -= 1
+        if item is None:
+            return None
+        move, score, depth, scores, exact = item
+        self._history[move] = (scores, exact)
+        item = (move, score, depth)
+        self.results.append(item)
+        # Result depths count the root move; the child itself was searched one ply less
+        if self.game == 'checkers' and depth > 1:
+            child = checkers_apply(self.board, move)
+            get_opening_book().store(child, 'b' if self.turn == 'r' else 'r', depth - 1, -score)
+        return item
+
+    @property
+    def done(self):
+        return self._pending == 0
+
+    def ranked(self):
+        first, rest = self.ranked_groups()
+        return first + rest
+
+    def ranked_groups(self):
+        """Scores from different depths do not compare (odd/even plies swing).
+        Moves are scored at the deepest depth every searched move has a score
+        for; exact results hold at any depth. Cache-seeded moves only have
+        scores from their cached depth on, so when no such common depth exists
+        the moves scored at the shallowest final depth are ranked first and the
+        others follow as a separate group, ordered by depth then score."""
+        scored = {move: self._history[move][0] for move, _, _ in self.results
+                  if move in self._history and not self._history[move][1] and self._history[move][0]}
+        common = set.intersection(*(set(s) for s in scored.values())) if scored else set()
+        ref = max(common) if common else min((max(s) for s in scored.values()), default=0)
+        first, rest = [], []
+        for move, score, depth in self.results:
+            scores = scored.get(move)
+            if scores is None:
+                # Exact result, or a move the deadline stopped before depth 1
+                (first if self._history.get(move, ({}, True))[1] else rest).append((move, score, depth))
+            elif ref in scores:
+                first.append((move, scores[ref], ref))
+            else:
+                at = min(d for d in scores if d > ref)
+                rest.append((move, scores[at], at))
+        return sorted(first, key=lambda res: -res[1]), sorted(rest, key=lambda res: (res[2], -res[1]))
+
+    def poll(self):
+        # Non-blocking: results that arrived since the last call
+        new = []
+        while not self.done:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if self._collect(item):
+                new.append(item)
+        if self.done:
+            self.close()
+        return new
+
+    def __iter__(self):
+        while not self.done:
+            item = self._collect(self._queue.get())
+            if item:
+                yield item
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            if self.done:
+                self._pool.join()
+            else:
+                self._pool.terminate()
+            self._pool = None
+        if self.done and self.game == 'checkers':
+            save_opening_book()
+
+
+def _analyse_slice(game, board, turn, move, deadline, budget, max_depth, cached):
+    return analyse_move(game, board, turn, move, min(deadline, time.time() + budget), max_depth, cached)
+
+
+#####################
+# Sudoku Logic (headless)
+#####################
+# Grids are flat lists of 81 ints, 0 for an empty cell. Text form is one
+# puzzle per line, 81 chars, with '0' or '.' for blanks.
+SUDOKU_ROW = [i // 9 for i in range(81)]
+SUDOKU_COL = [i % 9 for i in range(81)]
+SUDOKU_BOX = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+SUDOKU_ALL = 0x3FE  # bits 1..9
+SUDOKU_UNITS = ([[r * 9 + c for c in range(9)] for r in range(9)] +
+                [[r * 9 + c for r in range(9)] for c in range(9)] +
+                [[i for i in range(81) if SUDOKU_BOX[i] == b] for b in range(9)])
+SUDOKU_PEERS = [sorted({p for u in SUDOKU_UNITS if i in u for p in u} - {i}) for i in range(81)]
+
+
+def sudoku_parse(line):
+    line = line.strip()
+    if len(line) != 81:
+        raise ValueError(f"expected 81 cells, got {len(line)}")
+    grid = []
+    for ch in line:
+        if ch in '.0':
+            grid.append(0)
+        elif '1' <= ch <= '9':
+            grid.append(ord(ch) - 48)
+        else:
+            raise ValueError(f"invalid cell {ch!r}")
+    return grid
+
+
+def sudoku_format(grid):
+    return ''.join(str(v) if v else '.' for v in grid)
+
+
+def sudoku_from_rows(rows):
+    # Accepts the SudokuFrame.PUZZLE layout (9 rows, '' or digits as int/str)
+    return [int(v) if v != '' else 0 for row in rows for v in row]
+
+
+def _sudoku_masks(grid):
+    rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+    for i, v in enumerate(grid):
+        if v:
+            bit = 1 << v
+            r, c, b = SUDOKU_ROW[i], SUDOKU_COL[i], SUDOKU_BOX[i]
+            if (rows[r] | cols[c] | boxes[b]) & bit:
+                return None
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+    return rows, cols, boxes
+
+
+def sudoku_is_valid(grid):
+    # True when the givens do not conflict (empty cells allowed)
+    return _sudoku_masks(grid) is not None
+
+
+def sudoku_is_solved(grid):
+    return all(grid) and sudoku_is_valid(grid)
+
+
+def sudoku_search(grid, limit=1, rng=None):
+    """Backtracking with bitmasks and fewest-candidates ordering.
+    Returns (number of solutions found up to limit, first solution or None)."""
+    masks = _sudoku_masks(grid)
+    if masks is None:
+        return 0, None
+    rows, cols, boxes = masks
+    grid = list(grid)
+    empties = [i for i in range(81) if not grid[i]]
+    found = []
+
+    def solve(n):
+        if n == len(empties):
+            found.append(list(grid))
+            return len(found) >= limit
+        # Pick the empty cell with the fewest candidates and swap it into slot n
+        best, best_free, best_count = n, 0, 10
+        for k in range(n, len(empties)):
+            i = empties[k]
+            free = SUDOKU_ALL & ~(rows[SUDOKU_ROW[i]] | cols[SUDOKU_COL[i]] | boxes[SUDOKU_BOX[i]])
+            count = bin(free).count('1')
+            if count < best_count:
+                best, best_free, best_count = k, free, count
+                if count <= 1:
+                    break
+        if best_count == 0:
+            return False
+        empties[n], empties[best] = empties[best], empties[n]
+        i = empties[n]
+        r, c, b = SUDOKU_ROW[i], SUDOKU_COL[i], SUDOKU_BOX[i]
+        digits = [d for d in range(1, 10) if best_free & (1 << d)]
+        if rng is not None:
+            rng.shuffle(digits)
+        for d in digits:
+            bit = 1 << d
+            grid[i] = d
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+            stop = solve(n + 1)
+            rows[r] ^= bit
+            cols[c] ^= bit
+            boxes[b] ^= bit
+            grid[i] = 0
+            if stop:
+                return True
+        empties[n], empties[best] = empties[best], empties[n]
+        return False
+
+    solve(0)
+    return len(found), (found[0] if found else None)
+
+
+def sudoku_solve(grid):
+    return sudoku_search(grid)[1]
+
+
+def sudoku_generate(clues=30, seed=None):
+    # Random full grid, then dig holes while the solution stays unique
+    rng = random.Random(seed)
+    _, grid = sudoku_search([0] * 81, rng=rng)
+    cells = list(range(81))
+    rng.shuffle(cells)
+    filled = 81
+    for i in cells:
+        if filled <= clues:
+            break
+        v = grid[i]
+        grid[i] = 0
+        if sudoku_search(grid, limit=2)[0] != 1:
+            grid[i] = v
+        else:
+            filled -= 1
+    return grid
+
+
+#####################
+# Sudoku Hints
+#####################
+SudokuStep = namedtuple('SudokuStep', 'technique placements eliminations cells message')
+
+# Techniques in the order they are tried, with their weight for difficulty rating
+SUDOKU_TECHNIQUES = (
+    ('naked single', 1),
+    ('hidden single', 2),
+    ('pointing pair', 4),
+    ('box/line reduction', 4),
+    ('naked pair', 5),
+    ('hidden pair', 6),
+    ('x-wing', 8),
+)
+SUDOKU_LEVELS = {'naked single': 'easy', 'hidden single': 'easy',
+                 'pointing pair': 'medium', 'box/line reduction': 'medium',
+                 'naked pair': 'hard', 'hidden pair': 'hard', 'x-wing': 'expert'}
+
+
+def _cell_name(i):
+    return f"r{SUDOKU_ROW[i] + 1}c{SUDOKU_COL[i] + 1}"
+
+
+def _unit_name(k):
+    return ('row', 'column', 'box')[k // 9] + f" {k % 9 + 1}"
+
+
+def _digits(mask):
+    return [d for d in range(1, 10) if mask & (1 << d)]
+
+
+class SudokuCandidates:
+    # Candidate bitmask per cell, kept up to date as digits are placed or
+    # eliminated so hints never rebuild the whole grid from scratch.
+    def __init__(self, grid=None):
+        self.grid = [0] * 81
+        self.cands = [SUDOKU_ALL] * 81
+        self.ok = True
+        for i, v in enumerate(grid or ()):
+            if v:
+                self.place(i, v)
+
+    def copy(self):
+        other = SudokuCandidates.__new__(SudokuCandidates)
+        other.grid = list(self.grid)
+        other.cands = list(self.cands)
+        other.ok = self.ok
+        return other
+
+    def place(self, i, d):
+        bit = 1 << d
+        if not self.cands[i] & bit:
+            self.ok = False
+        self.grid[i] = d
+        self.cands[i] = 0
+        for p in SUDOKU_PEERS[i]:
+            if self.grid[p] == d:
+                self.ok = False
+            self.cands[p] &= ~bit
+
+    def eliminate(self, i, d):
+        self.cands[i] &= ~(1 << d)
+        if not self.grid[i] and not self.cands[i]:
+            self.ok = False
+
+    def apply(self, step):
+        for i, d in step.eliminations:
+            self.eliminate(i, d)
+        for i, d in step.placements:
+            self.place(i, d)
+
+    def next_step(self):
+        if not self.ok:
+            return None
+        for find in (self._naked_single, self._hidden_single, self._pointing, self._box_line,
+                     self._naked_pair, self._hidden_pair, self._x_wing):
+            step = find()
+            if step:
+                return step
+        return None
+
+    # --- Techniques ---
+    def _naked_single(self):
+        for i in range(81):
+            m = self.cands[i]
+            if m and not m & (m - 1):
+                d = m.bit_length() - 1
+                return SudokuStep('naked single', [(i, d)], [], [i],
+                                  f"Naked single: {_cell_name(i)} can only be {d}")
+
+    def _hidden_single(self):
+        for k, unit in enumerate(SUDOKU_UNITS):
+            for d in range(1, 10):
+                bit = 1 << d
+                cells = [i for i in unit if self.cands[i] & bit]
+                if len(cells) == 1:
+                    i = cells[0]
+                    return SudokuStep('hidden single', [(i, d)], [], [i],
+                                      f"Hidden single: {d} fits only in {_cell_name(i)} in {_unit_name(k)}")
+
+    def _pointing(self):
+        for b in range(9):
+            box = SUDOKU_UNITS[18 + b]
+            for d in range(1, 10):
+                bit = 1 << d
+                cells = [i for i in box if self.cands[i] & bit]
+                if len(cells) < 2:
+                    continue
+                for k, key in ((SUDOKU_ROW[cells[0]], SUDOKU_ROW), (9 + SUDOKU_COL[cells[0]], SUDOKU_COL)):
+                    if all(key[i] == key[cells[0]] for i in cells):
+                        elims = [(i, d) for i in SUDOKU_UNITS[k]
+                                 if SUDOKU_BOX[i] != b and self.cands[i] & bit]
+                        if elims:
+                            return SudokuStep('pointing pair', [], elims, cells,
+                                              f"Pointing pair: in box {b + 1}, {d} is confined to "
+                                              f"{_unit_name(k)}; remove it from the rest of that line")
+
+    def _box_line(self):
+        for k in range(18):
+            for d in range(1, 10):
+                bit = 1 << d
+                cells = [i for i in SUDOKU_UNITS[k] if self.cands[i] & bit]
+                if len(cells) < 2 or any(SUDOKU_BOX[i] != SUDOKU_BOX[cells[0]] for i in cells):
+                    continue
+                b = SUDOKU_BOX[cells[0]]
+                elims = [(i, d) for i in SUDOKU_UNITS[18 + b] if i not in cells and self.cands[i] & bit]
+                if elims:
+                    return SudokuStep('box/line reduction', [], elims, cells,
+                                      f"Box/line reduction: in {_unit_name(k)}, {d} is confined to "
+                                      f"box {b + 1}; remove it from the rest of the box")
+
+    def _naked_pair(self):
+        for k, unit in enumerate(SUDOKU_UNITS):
+            pairs = [i for i in unit if bin(self.cands[i]).count('1') == 2]
+            for x in range(len(pairs)):
+                for y in range(x + 1, len(pairs)):
+                    a, b = pairs[x], pairs[y]
+                    m = self.cands[a]
+                    if self.cands[b] != m:
+                        continue
+                    elims = [(i, d) for i in unit if i != a and i != b
+                             for d in _digits(self.cands[i] & m)]
+                    if elims:
+                        d1, d2 = _digits(m)
+                        return SudokuStep('naked pair', [], elims, [a, b],
+                                          f"Naked pair: {_cell_name(a)} and {_cell_name(b)} hold {d1}/{d2}; "
+                                          f"remove them from the rest of {_unit_name(k)}")
+
+    def _hidden_pair(self):
+        for k, unit in enumerate(SUDOKU_UNITS):
+            where = {}
+            for d in range(1, 10):
+                cells = tuple(i for i in unit if self.cands[i] & (1 << d))
+                if len(cells) == 2:
+                    where.setdefault(cells, []).append(d)
+            for cells, ds in where.items():
+                if len(ds) != 2:
+                    continue
+                keep = (1 << ds[0]) | (1 << ds[1])
+                elims = [(i, d) for i in cells for d in _digits(self.cands[i] & ~keep)]
+                if elims:
+                    a, b = cells
+                    return SudokuStep('hidden pair', [], elims, list(cells),
+                                      f"Hidden pair: {ds[0]}/{ds[1]} only fit in {_cell_name(a)} and "
+                                      f"{_cell_name(b)} in {_unit_name(k)}; remove other candidates there")
+
+    def _x_wing(self):
+        for d in range(1, 10):
+            bit = 1 << d
+            for base, cover, name in ((SUDOKU_ROW, SUDOKU_COL, 'rows'), (SUDOKU_COL, SUDOKU_ROW, 'columns')):
+                off = 0 if base is SUDOKU_ROW else 9
+                lines = {}
+                for n in range(9):
+                    cells = [i for i in SUDOKU_UNITS[off + n] if self.cands[i] & bit]
+                    if len(cells) == 2:
+                        lines.setdefault(tuple(cover[i] for i in cells), []).append(n)
+                for covers, found in lines.items():
+                    if len(found) != 2:
+                        continue
+                    coff = 9 - off
+                    elims = [(i, d) for c in covers for i in SUDOKU_UNITS[coff + c]
+                             if base[i] not in found and self.cands[i] & bit]
+                    if elims:
+                        cells = [i for n in found for i in SUDOKU_UNITS[off + n] if cover[i] in covers]
+                        return SudokuStep('x-wing', [], elims, cells,
+                                          f"X-wing on {d}: {name} {found[0] + 1} and {found[1] + 1}; "
+                                          f"remove {d} elsewhere in the two crossing lines")
+
+
+def sudoku_trace(grid):
+    # Solve by logic only; returns (steps, solved?)
+    cands = SudokuCandidates(grid)
+    steps = []
+    while cands.ok and not all(cands.grid):
+        step = cands.next_step()
+        if step is None:
+            break
+        cands.apply(step)
+        steps.append(step)
+    return steps, cands.ok and all(cands.grid)
+
+
+def sudoku_rate(grid):
+    # Returns (level, score) from the hardest technique the logical trace needs
+    steps, solved = sudoku_trace(grid)
+    weights = dict(SUDOKU_TECHNIQUES)
+    score = sum(weights[s.technique] for s in steps)
+    if not solved:
+        return 'diabolical', score
+    hardest = max((s.technique for s in steps), key=weights.get, default='naked single')
+    return SUDOKU_LEVELS[hardest], score
+
+
+#####################
+# Sudoku Batch CLI
+#####################
+def _sudoku_job(mode, items, clues):
+    # Runs in a worker process: returns (output lines, number of failures)
+    out = []
+    failures = 0
+    for item in items:
+        if mode == 'generate':
+            out.append(sudoku_format(sudoku_generate(clues, item)))
+            continue
+        try:
+            grid = sudoku_parse(item)
+        except ValueError:
+            out.append(f"malformed\t{item}" if mode == 'validate' else 'malformed')
+            failures += 1
+            continue
+        if mode == 'solve':
+            solution = sudoku_solve(grid)
+            if solution is None:
+                out.append('unsolvable')
+                failures += 1
+            else:
+                out.append(sudoku_format(solution))
+        elif mode == 'rate':
+            if sudoku_search(grid, limit=2)[0] != 1:
+                out.append(f"invalid\t-\t{sudoku_format(grid)}")
+                failures += 1
+            else:
+                level, score = sudoku_rate(grid)
+                out.append(f"{level}\t{score}\t{sudoku_format(grid)}")
+        else:
+            count, _ = sudoku_search(grid, limit=2)
+            if count == 0:
+                status = 'invalid'
+                failures += 1
+            elif all(grid):
+                status = 'solved'
+            elif count == 1:
+                status = 'unique'
+            else:
+                status = 'multiple'
+            out.append(f"{status}\t{sudoku_format(grid)}")
+    return out, failures
+
+
+def _chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def sudoku_cli(argv):
+    parser = argparse.ArgumentParser(prog='games.py sudoku',
+                                     description="Solve, validate, rate or generate Sudoku puzzles without the GUI.")
+    parser.add_argument('mode', choices=('solve', 'validate', 'rate', 'generate'))
+    parser.add_argument('files', nargs='*', help="input files, one puzzle per line ('-' or nothing for stdin)")
+    parser.add_argument('-o', '--output', default='-', help="output file (default stdout)")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-size', type=int, default=256)
+    parser.add_argument('-n', '--count', type=int, default=100, help="generate: number of puzzles")
+    parser.add_argument('--clues', type=int, default=30, help="generate: target number of givens")
+    parser.add_argument('--seed', type=int, default=0, help="generate: first seed")
+    args = parser.parse_args(argv)
+    if args.jobs < 1 or args.chunk_size < 1:
+        parser.error("--jobs and --chunk-size must be >= 1")
+
+    if args.mode == 'generate':
+        items = range(args.seed, args.seed + args.count)
+    else:
+        lines = fileinput.input(files=args.files or ('-',))
+        items = (line.strip() for line in lines if line.strip())
+
+    try:
+        out = sys.stdout if args.output == '-' else open(args.output, 'w')
+    except OSError as exc:
+        parser.error(f"cannot write {args.output}: {exc.strerror}")
+    total = failures = 0
+    start = time.perf_counter()
+
+    def emit(result):
+        nonlocal total, failures
+        lines, failed = result
+        if lines:
+            out.write('\n'.join(lines) + '\n')
+        total += len(lines)
+        failures += failed
+
+    try:
+        chunks = _chunked(items, args.chunk_size)
+        if args.jobs == 1:
+            for chunk in chunks:
+                emit(_sudoku_job(args.mode, chunk, args.clues))
+        else:
+            # Keep a bounded window of chunks in flight and write them back in input order
+            with multiprocessing.Pool(args.jobs) as pool:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.apply_async(_sudoku_job, (args.mode, chunk, args.clues)))
+                    if len(pending) >= args.jobs * 2:
+                        emit(pending.popleft().get())
+                while pending:
+                    emit(pending.popleft().get())
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); leaving the with block
+        # terminated the pool, so silence stdout and stop quietly.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except OSError as exc:
+        # Missing or unreadable input file (fileinput opens them lazily), failed write
+        name = f" {exc.filename}" if exc.filename else ""
+        print(f"games.py sudoku: error:{name}: {exc.strerror or exc}", file=sys.stderr)
+        return 2
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"sudoku {args.mode}: {total} puzzles, {failures} failed, {elapsed:.2f}s "
+          f"({rate:.0f} puzzles/s, {args.jobs} jobs)", file=sys.stderr)
+    return 1 if failures else 0
+
+
 #####################
 # Main Execution
 #####################
-def main():
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'sudoku':
+        return sudoku_cli(argv[1:])
+    if argv and argv[0] == 'checkers-book':
+        return checkers_book_cli(argv[1:])
     app = GameApp()
-    app.mainloop()if __name__ == "__main__":
-main()
\ No newline at end of file
+    app.mainloop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())